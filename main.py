@@ -1,21 +1,63 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional, List
-import io
+from typing import BinaryIO, Optional, List
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import itertools
 import os
-from translate import Translator
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+import httpx
 from docx import Document
 from PyPDF2 import PdfReader
 from PIL import Image
 import pytesseract
-from tempfile import NamedTemporaryFile
 try:
-    from transformers import pipeline, AutoTokenizer
+    import fitz  # PyMuPDF
 except Exception as _e:
-    pipeline = None
-    AutoTokenizer = None
-    print(f"Warning: transformers not installed: {_e}")
+    fitz = None
+    print(f"Warning: PyMuPDF not installed, falling back to PyPDF2 for PDFs: {_e}")
+
+try:
+    import cv2
+    import numpy as np
+except Exception as _e:
+    cv2 = None
+    np = None
+    print(f"Warning: opencv not installed, OCR input will not be preprocessed: {_e}")
+
+try:
+    from tesserocr import PyTessBaseAPI
+except Exception as _e:
+    PyTessBaseAPI = None
+    print(f"Warning: tesserocr not installed, falling back to pytesseract: {_e}")
+
+# Use the Rust hf_transfer downloader for model weights when it is installed.
+# huggingface_hub reads this at import and errors if the package is missing.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# transformers is imported lazily by ensure_model_loaded so server startup
+# doesn't pay for it
+pipeline = None
+AutoTokenizer = None
+
+# CPU inference threads per process. OpenMP/MKL read their env vars at
+# torch import, so these must be set first. Workers started via __main__
+# get a per-worker share exported by the parent; these are only fallbacks.
+_THREAD_ENV_VARS = ("TORCH_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS")
+_THREAD_ENV_PRESET = {k for k in _THREAD_ENV_VARS if k in os.environ}
+TORCH_NUM_THREADS = int(os.environ.get("TORCH_NUM_THREADS", os.cpu_count() or 4))
+os.environ.setdefault("OMP_NUM_THREADS", str(TORCH_NUM_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(TORCH_NUM_THREADS))
 
 try:
     import torch
@@ -24,6 +66,21 @@ except Exception as _e:
     print(f"Warning: torch not installed: {_e}")
 
 
+
+def configure_torch_threads():
+    """Apply TORCH_NUM_THREADS to torch's thread pools; called once per server process at startup."""
+    if torch is None:
+        return
+    torch.set_num_threads(TORCH_NUM_THREADS)
+    try:
+        torch.set_num_interop_threads(max(1, TORCH_NUM_THREADS // 4))
+    except RuntimeError:
+        # Only settable before any inter-op parallel work has started
+        pass
+    torch.backends.mkldnn.enabled = True
+    print(f"torch threads: intra-op={torch.get_num_threads()}, inter-op={torch.get_num_interop_threads()}")
+
+
 app = FastAPI(title="Multilingual Summarizer API")
 
 app.add_middleware(
@@ -37,6 +94,9 @@ app.add_middleware(
 # Configure Tesseract path if installed in default Windows location; adjust if needed
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 
+# MyMemory translation endpoint (the service previously used via the `translate` package)
+TRANSLATE_URL = "https://api.mymemory.translated.net/get"
+
 # Supported languages
 SUPPORTED_LANGUAGES = {
     "en": "English",
@@ -54,6 +114,10 @@ SUPPORTED_LANGUAGES = {
 }
 
 
+# A sentence runs up to terminal punctuation followed by whitespace, or to the end of text
+_SENT_RE = re.compile(r"\S.*?(?:(?<=[.!?])(?=\s)|$)", re.S)
+
+
 class SummarizationRequest(BaseModel):
     text: str
     target_language: str = "en"
@@ -61,64 +125,277 @@ class SummarizationRequest(BaseModel):
     min_length: Optional[int] = 50
 
 
-async def extract_text_from_docx(content: bytes) -> str:
-    doc = Document(io.BytesIO(content))
+def extract_text_from_docx(stream: BinaryIO) -> str:
+    doc = Document(stream)
     paragraphs = [p.text for p in doc.paragraphs if p.text and p.text.strip()]
     return "\n\n".join(paragraphs)
 
 
-async def extract_text_from_pdf(content: bytes) -> str:
+def extract_text_from_pdf(stream: BinaryIO) -> str:
     try:
-        pdf = PdfReader(io.BytesIO(content))
-        pages: List[str] = []
-        for page in pdf.pages:
-            ptext = page.extract_text() or ""
-            if ptext.strip():
-                pages.append(ptext)
+        if fitz is not None:
+            # PyMuPDF needs an in-memory buffer rather than a generic file object
+            with fitz.open(stream=stream.read(), filetype="pdf") as doc:
+                texts = [page.get_text() for page in doc]
+        else:
+            pdf = PdfReader(stream)
+            texts = [page.extract_text() or "" for page in pdf.pages]
+        pages: List[str] = [t for t in texts if t.strip()]
         return "\n\n".join(pages)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to extract PDF text: {e}")
 
 
-async def extract_text_from_image(content: bytes) -> str:
-    tmp_path = None
+# One Tesseract API handle per worker thread, so language data is loaded once
+_tess_local = threading.local()
+# Set once tesserocr fails to initialize (e.g. tessdata not found); OCR then
+# goes through pytesseract for the rest of the process
+_tesserocr_disabled = False
+_tesserocr_lock = threading.Lock()
+
+
+def _get_tess_api():
+    """Return this thread's tesserocr handle, or None if pytesseract should be used."""
+    global _tesserocr_disabled
+    if PyTessBaseAPI is None or _tesserocr_disabled:
+        return None
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        try:
+            api = PyTessBaseAPI()
+        except Exception as e:
+            with _tesserocr_lock:
+                if not _tesserocr_disabled:
+                    _tesserocr_disabled = True
+                    print(f"Warning: tesserocr failed to initialize, falling back to pytesseract: {e}")
+            return None
+        _tess_local.api = api
+    return api
+
+
+def preprocess_for_ocr(img: Image.Image) -> Image.Image:
+    """Grayscale, Otsu-binarize and median-denoise an RGB image before OCR."""
+    if cv2 is None:
+        return img
+    gray = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2GRAY)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return Image.fromarray(cv2.medianBlur(binary, 3))
+
+
+def extract_text_from_image(stream: BinaryIO) -> str:
     try:
-        with NamedTemporaryFile(delete=False, suffix=".png") as f:
-            f.write(content)
-            tmp_path = f.name
-        img = Image.open(tmp_path)
+        img = Image.open(stream)
         if img.mode != "RGB":
             img = img.convert("RGB")
-        text = pytesseract.image_to_string(img)
-        return text
+        img = preprocess_for_ocr(img)
+        api = _get_tess_api()
+        if api is None:
+            return pytesseract.image_to_string(img)
+        api.SetImage(img)
+        return api.GetUTF8Text()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OCR failed: {e}")
-    finally:
-        try:
-            if tmp_path and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-        except Exception:
-            pass
 
 
 # Load summarization model and tokenizer
 # Use a smaller model for faster local testing. Swap back to a larger model
 # (facebook/bart-large-cnn) for final production runs if you have the disk/time.
 MODEL_NAME = "sshleifer/distilbart-cnn-12-6"
-try:
-    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-    device = 0 if torch.cuda.is_available() else -1
-    summarizer = pipeline("summarization", model=MODEL_NAME, tokenizer=tokenizer, device=device)
-except Exception as e:
-    # allow server start; model loading errors will be raised on request
-    summarizer = None
-    tokenizer = None
-    print(f"Warning: could not load model '{MODEL_NAME}': {e}")
+# Number of chunks the pipeline summarizes per forward pass; tune per device
+SUMMARIZER_BATCH_SIZE = max(1, int(os.environ.get("SUMMARIZER_BATCH_SIZE", "8")))
+# Compile the model's forward with torch.compile (opt-in; set to 1 to enable)
+SUMMARIZER_COMPILE = os.environ.get("SUMMARIZER_COMPILE", "0") == "1"
+# Serve the encoder through a frozen TorchScript trace (opt-in; set to 1 to enable)
+SUMMARIZER_TORCHSCRIPT = os.environ.get("SUMMARIZER_TORCHSCRIPT", "0") == "1"
+# Inference backend: "torch" (default) or "onnx" to serve an exported model through ONNX Runtime
+SUMMARIZER_BACKEND = os.environ.get("SUMMARIZER_BACKEND", "torch").lower()
+# Where the ONNX export is cached between runs
+ONNX_MODEL_DIR = os.environ.get("ONNX_MODEL_DIR", "./onnx-bart")
+
+
+@functools.lru_cache(maxsize=None)
+def _cpu_supports_bf16() -> bool:
+    """True if the CPU has native BF16 instructions (AVX512-BF16 or AMX)."""
+    # Private torch helper; its name differs between releases
+    torch_cpu = getattr(torch, "cpu", None)
+    for name in ("_is_avx512_bf16_supported", "_is_cpu_support_avx512_bf16"):
+        check = getattr(torch_cpu, name, None)
+        if check is not None:
+            try:
+                return bool(check())
+            except Exception:
+                break
+    # Fall back to the kernel's CPU flags where available (Linux)
+    try:
+        with open("/proc/cpuinfo") as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
+
+
+def _model_dtype():
+    """Pick the half-precision dtype for the current device, or None to stay in FP32."""
+    if torch.cuda.is_available():
+        return torch.float16
+    if _cpu_supports_bf16():
+        return torch.bfloat16
+    return None
+
+
+def _trace_encoder(model, tok):
+    """Replace the model's encoder with a frozen TorchScript trace.
+
+    generate() runs the encoder once per call and reuses its output across
+    decode steps, so only that single encoder forward is JIT-optimized.
+    """
+    from transformers.modeling_outputs import BaseModelOutput
+
+    encoder = model.get_encoder()
+    example = tok("warmup text " * 32, return_tensors="pt").to(model.device)
+    with torch.no_grad():
+        traced = torch.jit.trace(encoder, (example["input_ids"], example["attention_mask"]), strict=False)
+        traced = torch.jit.freeze(traced.eval())
+
+    class _TracedEncoder(torch.nn.Module):
+        main_input_name = "input_ids"
+
+        def __init__(self):
+            super().__init__()
+            self.traced = traced
+
+        def forward(self, input_ids=None, attention_mask=None, **kwargs):
+            out = self.traced(input_ids, attention_mask)
+            return BaseModelOutput(last_hidden_state=out["last_hidden_state"])
+
+    traced_encoder = _TracedEncoder()
+    model.get_encoder = lambda: traced_encoder
+
+
+def _onnx_export_ready(path: str) -> bool:
+    """True if path holds a complete seq2seq ONNX export (config plus encoder and decoder graphs)."""
+    if not os.path.isfile(os.path.join(path, "config.json")):
+        return False
+    files = os.listdir(path)
+    return "encoder_model.onnx" in files and any(
+        f.startswith("decoder_model") and f.endswith(".onnx") for f in files
+    )
+
+
+def _export_onnx_model():
+    """Export MODEL_NAME to ONNX_MODEL_DIR, writing to a temp dir first so a
+    failed or interrupted export never leaves a half-written model behind."""
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    parent = os.path.dirname(os.path.abspath(ONNX_MODEL_DIR))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".onnx-export-", dir=parent)
+    try:
+        ort_model = ORTModelForSeq2SeqLM.from_pretrained(MODEL_NAME, export=True, provider="CPUExecutionProvider")
+        ort_model.save_pretrained(tmp_dir)
+        # Another worker may have finished its export while this one ran
+        if _onnx_export_ready(ONNX_MODEL_DIR):
+            return
+        if os.path.isdir(ONNX_MODEL_DIR):
+            # Leftover from an incomplete export
+            shutil.rmtree(ONNX_MODEL_DIR)
+        os.replace(tmp_dir, ONNX_MODEL_DIR)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _create_onnx_summarizer(tok):
+    """Build a pipeline around an ONNX Runtime model, exporting it on first use."""
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    if not _onnx_export_ready(ONNX_MODEL_DIR):
+        _export_onnx_model()
+    ort_model = ORTModelForSeq2SeqLM.from_pretrained(ONNX_MODEL_DIR, provider="CPUExecutionProvider")
+    return pipeline("summarization", model=ort_model, tokenizer=tok)
+
+
+def _create_summarizer(tok):
+    if SUMMARIZER_BACKEND == "onnx":
+        try:
+            return _create_onnx_summarizer(tok)
+        except Exception as e:
+            print(f"Warning: ONNX Runtime backend unavailable, using PyTorch: {e}")
+
+    device = 0 if getattr(torch, 'cuda', None) and torch.cuda.is_available() else -1
+    model_kwargs = {}
+    dtype = _model_dtype()
+    if dtype is not None:
+        model_kwargs["torch_dtype"] = dtype
+    print(f"Summarizer dtype: {dtype or torch.float32} ({'cuda' if device == 0 else 'cpu'})")
+    summ = pipeline("summarization", model=MODEL_NAME, tokenizer=tok, device=device, model_kwargs=model_kwargs)
+    # Inference only: make sure dropout is off regardless of how the weights were loaded
+    summ.model.eval()
+    if SUMMARIZER_TORCHSCRIPT:
+        try:
+            _trace_encoder(summ.model, tok)
+        except Exception as e:
+            print(f"Warning: TorchScript encoder trace failed, using eager encoder: {e}")
+    if SUMMARIZER_COMPILE and hasattr(torch, "compile"):
+        # Compile forward rather than wrapping the module: generate() is looked up
+        # on the original model and would bypass an OptimizedModule wrapper.
+        # dynamic=True avoids recompiling for every new batch/beam/cache shape.
+        # Compilation is lazy, so backend errors only surface on the first call;
+        # warmup_summarizer restores the eager forward kept here if that fails.
+        eager_forward = summ.model.forward
+        try:
+            summ.model.forward = torch.compile(eager_forward, dynamic=True, fullgraph=False)
+            summ.model._eager_forward = eager_forward
+        except Exception as e:
+            print(f"Warning: torch.compile failed, running eagerly: {e}")
+    return summ
+
+
+def warmup_summarizer(summ):
+    """Run one throwaway summarization so compilation happens before the first real request.
+
+    Must run before summ is published to request handlers: if the compiled
+    forward fails here it is swapped back to eager, which is only safe while
+    no request can be using the model.
+    """
+    # Go through the same generate() path real requests use
+    warmup_ids = chunk_token_ids("warmup text " * 100, tok=summ.tokenizer)
+    try:
+        _generate_summaries(warmup_ids, max_length=50, min_length=10, summ=summ)
+    except Exception as e:
+        eager_forward = getattr(summ.model, "_eager_forward", None)
+        if eager_forward is None:
+            raise
+        print(f"Warning: compiled model failed during warmup, running eagerly: {e}")
+        summ.model.forward = eager_forward
+        del summ.model._eager_forward
+        _generate_summaries(warmup_ids, max_length=50, min_length=10, summ=summ)
+
+
+def _inference_context() -> ExitStack:
+    """Context for model forward passes: no autograd, and BF16 autocast on capable CPUs.
+
+    inference_mode is used over no_grad since it also skips version-counter
+    and view tracking; every summarizer call goes through this.
+    """
+    stack = ExitStack()
+    if torch is None:
+        return stack
+    stack.enter_context(torch.inference_mode())
+    if not torch.cuda.is_available() and _cpu_supports_bf16():
+        stack.enter_context(torch.autocast("cpu", dtype=torch.bfloat16))
+    return stack
+
+
+# Populated by ensure_model_loaded, which runs in the background at startup
+tokenizer = None
+summarizer = None
+_model_load_lock = threading.Lock()
 
 
 def ensure_model_loaded():
     """Attempt to import/initialize transformers and torch and load the model lazily.
 
+    The model is warmed up before it becomes visible to request handlers.
     Raises HTTPException with actionable guidance if loading fails.
     """
     global pipeline, AutoTokenizer, torch, tokenizer, summarizer
@@ -126,68 +403,140 @@ def ensure_model_loaded():
     if summarizer is not None and tokenizer is not None:
         return
 
-    # Try to import missing libraries if they weren't available at module import
-    try:
-        if pipeline is None or AutoTokenizer is None:
-            from transformers import pipeline as _pipeline, AutoTokenizer as _AutoTokenizer
-            pipeline = _pipeline
-            AutoTokenizer = _AutoTokenizer
-    except Exception as ie:
-        raise HTTPException(status_code=500, detail=(
-            f"Required package 'transformers' is not available or failed to import: {ie}. "
-            "Install it in your backend venv: python -m pip install transformers sentencepiece"
-        ))
+    # Startup warmup and /load_model may race; only one thread loads
+    with _model_load_lock:
+        if summarizer is not None and tokenizer is not None:
+            return
 
-    try:
-        if torch is None:
-            import importlib
-            torch = importlib.import_module('torch')
-    except Exception as ie:
-        raise HTTPException(status_code=500, detail=(
-            f"Required package 'torch' is not available or failed to import: {ie}. "
-            "Install it in your backend venv (choose CPU or CUDA wheel): python -m pip install torch"
-        ))
-
-    # Finally load tokenizer and pipeline
-    try:
-        # Load tokenizer and summarizer (this may download model weights on first run)
-        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-        device = 0 if getattr(torch, 'cuda', None) and torch.cuda.is_available() else -1
-        summarizer = pipeline("summarization", model=MODEL_NAME, tokenizer=tokenizer, device=device)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=(
-            f"Failed to load model '{MODEL_NAME}': {e}. "
-            "Ensure the server has network access to download model weights or place the model in the local cache."
-        ))
+        # Try to import missing libraries if they weren't available at module import
+        try:
+            if pipeline is None or AutoTokenizer is None:
+                from transformers import pipeline as _pipeline, AutoTokenizer as _AutoTokenizer
+                pipeline = _pipeline
+                AutoTokenizer = _AutoTokenizer
+        except Exception as ie:
+            raise HTTPException(status_code=500, detail=(
+                f"Required package 'transformers' is not available or failed to import: {ie}. "
+                "Install it in your backend venv: python -m pip install transformers sentencepiece"
+            ))
 
+        try:
+            if torch is None:
+                import importlib
+                torch = importlib.import_module('torch')
+        except Exception as ie:
+            raise HTTPException(status_code=500, detail=(
+                f"Required package 'torch' is not available or failed to import: {ie}. "
+                "Install it in your backend venv (choose CPU or CUDA wheel): python -m pip install torch"
+            ))
+
+        # Finally load tokenizer and pipeline
+        try:
+            # Load tokenizer and summarizer (this may download model weights on first run)
+            # Fetch weights into the standard HF cache first; concurrent workers
+            # wait on the hub's file locks instead of racing inside from_pretrained.
+            # A cached ONNX export doesn't need the PyTorch weights at all.
+            if not (SUMMARIZER_BACKEND == "onnx" and _onnx_export_ready(ONNX_MODEL_DIR)):
+                from huggingface_hub import snapshot_download
+                snapshot_download(MODEL_NAME, ignore_patterns=["*.h5", "*.msgpack", "*.ot", "rust_model*"])
+
+            # The same (Rust-backed where available) tokenizer instance serves
+            # chunking and generation
+            tok = AutoTokenizer.from_pretrained(MODEL_NAME, use_fast=True)
+            if tok.is_fast:
+                print(f"Tokenizer for '{MODEL_NAME}': fast (Rust)")
+            else:
+                print(
+                    f"Warning: no fast tokenizer available for '{MODEL_NAME}'; "
+                    "using the slower Python tokenizer."
+                )
+            summ = _create_summarizer(tok)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=(
+                f"Failed to load model '{MODEL_NAME}': {e}. "
+                "Ensure the server has network access to download model weights or place the model in the local cache."
+            ))
+
+        # Warm up before publishing: until the globals are set, requests use the
+        # extractive fallback instead of racing warmup (and any compile) on the model
+        try:
+            warmup_summarizer(summ)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Model '{MODEL_NAME}' failed its warmup run: {e}")
+        tokenizer, summarizer = tok, summ
 
-def chunk_text_by_tokens(text: str, max_tokens: Optional[int] = None) -> List[str]:
-    if tokenizer is None:
-        # Naive fallback
-        words = text.split()
-        chunk_size = 800
-        return [" ".join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
 
-    model_max = min(getattr(tokenizer, "model_max_length", 1024), 1024)
+def chunk_token_ids(text: str, max_tokens: Optional[int] = None, tok=None) -> List[List[int]]:
+    """Tokenize text once and split the ids into model-sized windows, without special tokens."""
+    if tok is None:
+        tok = tokenizer
+    model_max = min(getattr(tok, "model_max_length", 1024), 1024)
     if max_tokens is None:
         max_tokens = max(256, model_max - 64)
 
-    words = text.split()
-    chunks: List[str] = []
-    current: List[str] = []
-    for w in words:
-        current.append(w)
-        joined = " ".join(current)
-        toks = tokenizer.encode(joined, add_special_tokens=False)
-        if len(toks) >= max_tokens:
-            # remove last word and finalize
-            current.pop()
-            if current:
-                chunks.append(" ".join(current))
-            current = [w]
-    if current:
-        chunks.append(" ".join(current))
-    return chunks
+    ids = tok(text, add_special_tokens=False)["input_ids"]
+    return [ids[start:start + max_tokens] for start in range(0, len(ids), max_tokens)]
+
+
+# LRU caches for model summaries and translations, keyed by a hash of the input text
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", "1024"))
+_summary_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_translation_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_cache_lock = asyncio.Lock()
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+async def _cache_get(cache: OrderedDict, key: tuple) -> Optional[str]:
+    async with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+async def _cache_put(cache: OrderedDict, key: tuple, value: str) -> None:
+    if RESULT_CACHE_SIZE <= 0:
+        return
+    async with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _generate_summaries(token_chunks: List[List[int]], max_length: int, min_length: int, summ=None) -> List[str]:
+    """Summarize pre-tokenized chunks with model.generate(), returning summaries in input order.
+
+    Chunks are already token ids, so they go straight to generate() instead of
+    being decoded and re-tokenized by the pipeline. They are sorted by length
+    and batched in groups of SUMMARIZER_BATCH_SIZE so each batch pads to a
+    near-equal length. summ defaults to the loaded summarizer pipeline.
+    """
+    if summ is None:
+        summ = summarizer
+    model, tok = summ.model, summ.tokenizer
+    order = sorted(range(len(token_chunks)), key=lambda i: len(token_chunks[i]))
+    summaries: List[str] = [""] * len(token_chunks)
+    with _inference_context():
+        for b in range(0, len(order), SUMMARIZER_BATCH_SIZE):
+            batch_idx = order[b:b + SUMMARIZER_BATCH_SIZE]
+            batch = tok.pad(
+                {"input_ids": [tok.build_inputs_with_special_tokens(token_chunks[i]) for i in batch_idx]},
+                return_tensors="pt",
+            ).to(summ.device)
+            output_ids = model.generate(
+                **batch,
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False,
+            )
+            decoded = tok.batch_decode(output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False)
+            for i, summary in zip(batch_idx, decoded):
+                summaries[i] = summary
+    return summaries
 
 
 async def summarize_with_local_model(text: str, max_length: int = 150, min_length: int = 50) -> str:
@@ -199,16 +548,22 @@ async def summarize_with_local_model(text: str, max_length: int = 150, min_lengt
         print("Summarizer pipeline not loaded; using fallback extractive summarizer.")
         return fallback_summarize(text, max_length=max_length, min_length=min_length)
 
-    chunks = chunk_text_by_tokens(text)
-    summaries: List[str] = []
-    for chunk in chunks:
-        try:
-            res = summarizer(chunk, max_length=max_length, min_length=min_length, do_sample=False)
-            summaries.append(res[0].get("summary_text", ""))
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Model error: {e}")
+    cache_key = (_text_digest(text), max_length, min_length)
+    cached = await _cache_get(_summary_cache, cache_key)
+    if cached is not None:
+        return cached
+
+    token_chunks = chunk_token_ids(text)
+    if not token_chunks:
+        return ""
+
+    try:
+        summaries = _generate_summaries(token_chunks, max_length=max_length, min_length=min_length)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Model error: {e}")
 
     final_summary = "\n\n".join(s.strip() for s in summaries if s and s.strip())
+    await _cache_put(_summary_cache, cache_key, final_summary)
     return final_summary
 
 
@@ -217,40 +572,43 @@ def fallback_summarize(text: str, max_length: int = 150, min_length: int = 50) -
 
     This keeps the API usable when a large HF model is unavailable.
     """
-    import re
+    # Sentences are produced lazily so only the leading ones are ever scanned
+    sentences = _SENT_RE.finditer(text.strip())
 
-    # Split into sentences (naive)
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-    if not sentences:
-        return text[:max_length]
-
-    selected = []
+    selected: List[str] = []
     words = 0
-    for s in sentences:
+    overflow: Optional[str] = None
+    for m in sentences:
+        s = m.group()
         sw = len(s.split())
         if words + sw <= max_length or not selected:
             selected.append(s.strip())
             words += sw
         else:
+            overflow = s
             break
 
-    summary = " ".join(selected)
     # Ensure we meet min_length roughly by adding more if needed
-    if len(summary.split()) < min_length:
-        # add more sentences if available
-        for s in sentences[len(selected):]:
-            summary += " " + s.strip()
-            if len(summary.split()) >= min_length:
+    if words < min_length and overflow is not None:
+        for s in itertools.chain([overflow], (m.group() for m in sentences)):
+            selected.append(s.strip())
+            words += len(s.split())
+            if words >= min_length:
                 break
 
-    return summary
+    return " ".join(selected)
 
 
 async def translate_text(text: str, target_lang: str) -> str:
     if not target_lang or target_lang.lower() == "en":
         return text
+
+    cache_key = (_text_digest(text), target_lang)
+    cached = await _cache_get(_translation_cache, cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        translator = Translator(to_lang=target_lang)
         # Break into moderate chunks to avoid remote limits
         MAX_CHUNK = 800
         words = text.split()
@@ -268,13 +626,27 @@ async def translate_text(text: str, target_lang: str) -> str:
         if cur:
             chunks.append(" ".join(cur))
 
+        # Issue all chunk requests concurrently so N chunks cost ~1 round-trip
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            responses = await asyncio.gather(*[
+                client.get(TRANSLATE_URL, params={"q": c, "langpair": f"en|{target_lang}"})
+                for c in chunks
+            ])
+
         translated_parts: List[str] = []
-        for c in chunks:
-            translated_parts.append(translator.translate(c))
-        return " ".join(translated_parts)
+        for resp in responses:
+            resp.raise_for_status()
+            data = resp.json()
+            if int(data.get("responseStatus", 200)) != 200:
+                raise RuntimeError(data.get("responseDetails") or "translation service error")
+            translated_parts.append(data["responseData"]["translatedText"])
+        translated = " ".join(translated_parts)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Translation failed: {e}")
 
+    await _cache_put(_translation_cache, cache_key, translated)
+    return translated
+
 
 @app.post("/summarize")
 async def summarize_text(req: SummarizationRequest):
@@ -303,18 +675,21 @@ async def upload_file(
         raise HTTPException(status_code=400, detail="No file provided")
 
     ext = os.path.splitext(file.filename)[1].lower()
-    content = await file.read()
+    # Binary formats are parsed straight from the spooled upload file rather
+    # than buffering the body into bytes first
     if ext in [".txt", ".md", ".rtf"]:
+        content = await file.read()
         try:
             text = content.decode("utf-8")
         except UnicodeDecodeError:
             text = content.decode("latin-1", errors="ignore")
     elif ext in [".docx", ".doc"]:
-        text = await extract_text_from_docx(content)
+        text = await asyncio.to_thread(extract_text_from_docx, file.file)
     elif ext == ".pdf":
-        text = await extract_text_from_pdf(content)
+        text = await asyncio.to_thread(extract_text_from_pdf, file.file)
     elif ext in [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff"]:
-        text = await extract_text_from_image(content)
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(app.state.ocr_executor, extract_text_from_image, file.file)
     else:
         raise HTTPException(status_code=400, detail=f"Unsupported file extension: {ext}")
 
@@ -339,6 +714,32 @@ async def get_languages():
     return {"languages": [{"code": k, "name": v} for k, v in SUPPORTED_LANGUAGES.items()]}
 
 
+def load_and_warmup_model():
+    try:
+        ensure_model_loaded()
+        print("Model loaded successfully.")
+    except Exception as e:
+        print(f"Model load failed in background: {e}")
+
+
+# Process-wide setup lives in startup rather than at import: uvicorn workers
+# import this module twice (as __mp_main__ and as main), and only the served
+# app's startup runs.
+@app.on_event("startup")
+async def _startup():
+    configure_torch_threads()
+    # Bounded pool for OCR so concurrent image uploads can't oversubscribe the CPU
+    app.state.ocr_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+    # Load in a worker thread so the server starts accepting requests right away;
+    # keep a reference so the task isn't garbage-collected mid-load.
+    app.state.warmup_task = asyncio.create_task(asyncio.to_thread(load_and_warmup_model))
+
+
+@app.on_event("shutdown")
+async def _shutdown():
+    app.state.ocr_executor.shutdown(wait=False)
+
+
 @app.post("/load_model")
 def load_model(background_tasks: BackgroundTasks):
     """Trigger downloading/loading the HF model in the background.
@@ -347,18 +748,32 @@ def load_model(background_tasks: BackgroundTasks):
     Returns immediately while the model loads in a background task.
     """
 
-    def _load():
-        try:
-            ensure_model_loaded()
-            print("Model loaded successfully.")
-        except Exception as e:
-            print(f"Model load failed in background: {e}")
-
-    background_tasks.add_task(_load)
+    background_tasks.add_task(load_and_warmup_model)
     return {"status": "loading_started", "model": MODEL_NAME}
 
 
 if __name__ == "__main__":
+    # uvicorn imports "main:app" as a separate module (in each spawned worker,
+    # or in this process when workers=1), so the import-time optional-dependency
+    # warnings above are expected to print twice per process.
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Each worker holds its own copy of the model, so a single GPU is best
+    # served by one worker; CPU deployments default to several.
+    default_workers = "1" if torch is not None and torch.cuda.is_available() else "4"
+    workers = int(os.environ.get("UVICORN_WORKERS", default_workers))
+    # Split the cores between workers so their thread pools don't oversubscribe.
+    # The module-level fallbacks above already ran in this process with the full
+    # core count, so overwrite every thread variable the operator didn't set;
+    # spawned workers inherit these before they import torch.
+    if "TORCH_NUM_THREADS" in _THREAD_ENV_PRESET:
+        per_worker_threads = TORCH_NUM_THREADS
+    else:
+        per_worker_threads = max(1, (os.cpu_count() or 4) // workers)
+    for var in _THREAD_ENV_VARS:
+        if var not in _THREAD_ENV_PRESET:
+            os.environ[var] = str(per_worker_threads)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=workers, loop=loop, http=http)